@@ -1,26 +1,164 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import importlib.resources
+import io
+import json
+import mmap
+import multiprocessing
+import os
 import re
 import sys
+import tempfile
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from itscalledsoccer.client import AmericanSoccerAnalysis
 from loguru import logger
 from parsimonious.nodes import Node
 from pydantic import BaseModel, Field
-from pypdf import PdfReader
+from pypdf import PageObject, PdfReader
 from rapidfuzz import fuzz, process, utils
 
 from mls_roster_profiles.models import Player, RosterProfile, Team
-from mls_roster_profiles.parsimonious.grammar import Grammar
+from mls_roster_profiles.parsimonious.grammar import Grammar, get_grammar
 from mls_roster_profiles.parsimonious.nodes import NodeVisitor
-from mls_roster_profiles.pypdf.enum import DelimiterGlyph
+from mls_roster_profiles.pypdf.enum import DelimiterGlyph, Entry
 from mls_roster_profiles.pypdf.reader import Page
 
-__all__ = ["RosterProfileRelease"]
+__all__ = ["PageParseError", "RosterProfileRelease"]
+
+_TEXT_OPERATORS_PATTERN = re.compile(rb"\bT[jJ]\b|\bDo\b")
+# Without `re.DOTALL`, matches cannot extend past the end of a single text object (i.e., line)
+_HYPHENATED_ATTRIBUTES_PATTERN = re.compile(rf"-{DelimiterGlyph.ATTRIBUTES_OPEN}.*?{DelimiterGlyph.ATTRIBUTES_CLOSE}\n")
+
+# NOTE: An empty `XDG_CACHE_HOME` is treated as unset, per the XDG Base Directory specification
+_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "mls_roster_profiles"
+# NOTE: Temporary files older than this are left over from interrupted writes, rather than belonging to one in progress
+_STALE_TEMP_SECONDS = 60 * 60
+_CACHE_MODES = frozenset({"on", "refresh", "off"})
+# NOTE: The keys each cached record must hold, as read when mapping names to IDs
+_CACHE_KEYS = {
+    "teams": ("ID", "Name"),
+    "players": ("ID", "Name", "Team(s)", "Position(s)", "Birth Date", "Nationality"),
+}
+
+
+@functools.cache
+def _get_asa_client() -> AmericanSoccerAnalysis:
+    """Returns a single `itscalledsoccer` client instance, shared across calls."""
+    return AmericanSoccerAnalysis()
+
+
+def _cache_mode() -> str:
+    """
+    Returns the on-disk cache mode, as set by the `MLS_ROSTER_PROFILES_CACHE` environment variable: "on" (the
+    default) to read and write the cache, "refresh" to refetch and overwrite it, or "off" to bypass it entirely.
+    """
+    mode = os.environ.get("MLS_ROSTER_PROFILES_CACHE", "on").strip().lower()
+    if mode not in _CACHE_MODES:
+        logger.warning(f"Unrecognized `MLS_ROSTER_PROFILES_CACHE` value '{mode}', defaulting to 'on'")
+        return "on"
+    return mode
+
+
+def _cache_path(name: str, as_of: datetime.date) -> Path:
+    """Returns the path of the cache file for the given dataset and date."""
+    return _CACHE_DIR / f"{name}-{as_of.isoformat()}.json"
+
+
+def _read_cache(name: str, as_of: datetime.date) -> list[dict[str, str]] | None:
+    """
+    Reads previously fetched `itscalledsoccer` records from the on-disk cache.
+
+    Unreadable or malformed cache files (e.g., left truncated by an interrupted write) are treated as
+    a cache miss, as is any read while the cache mode is "refresh" or "off".
+
+    Args:
+        name (str): The name of the cached dataset (e.g., "teams" or "players").
+        as_of (datetime.date): The date on which the records were fetched.
+
+    Returns:
+        list[dict[str, str]] | None: The cached records, or None if no valid cache file exists.
+
+    """
+    if _cache_mode() != "on":
+        return None
+
+    path = _cache_path(name, as_of)
+    try:
+        with open(path, encoding="utf-8") as f:
+            records = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable `itscalledsoccer` {name} cache: {e}")
+        return None
+
+    keys = _CACHE_KEYS[name]
+    if not isinstance(records, list) or not all(
+        isinstance(record, dict) and all(isinstance(record.get(key), str) for key in keys) for record in records
+    ):
+        logger.warning(f"Ignoring malformed `itscalledsoccer` {name} cache")
+        return None
+
+    return records
+
+
+def _write_cache(name: str, as_of: datetime.date, records: list[dict[str, str]]) -> None:
+    """
+    Writes fetched `itscalledsoccer` records to the on-disk cache, so that subsequent
+    processes can skip the network round-trip on the same day.
+
+    The records are written to a temporary file which then replaces the cache file, so that readers
+    never observe a partially written file. Cache files for the dataset from earlier dates are removed, as are
+    temporary files left over from interrupted writes.
+
+    Args:
+        name (str): The name of the cached dataset (e.g., "teams" or "players").
+        as_of (datetime.date): The date on which the records were fetched.
+        records (list[dict[str, str]]): The records to cache.
+
+    """
+    if _cache_mode() == "off":
+        return
+
+    path = _cache_path(name, as_of)
+    tmp_path: Path | None = None
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=_CACHE_DIR, prefix=f".{name}-", suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = Path(f.name)
+            json.dump(records, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Unable to cache `itscalledsoccer` {name}: {e}")
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        return
+
+    # NOTE: ISO dates sort lexicographically, so the names of older cache files compare less than the current one
+    stale_paths = [stale_path for stale_path in _CACHE_DIR.glob(f"{name}-*.json") if stale_path.name < path.name]
+    stale_before = time.time() - _STALE_TEMP_SECONDS
+    for stale_path in _CACHE_DIR.glob(f".{name}-*.tmp"):
+        try:
+            if stale_path.stat().st_mtime < stale_before:
+                stale_paths.append(stale_path)
+        except OSError:
+            continue
+
+    for stale_path in stale_paths:
+        try:
+            stale_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Unable to remove stale `itscalledsoccer` {name} cache: {e}")
 
 
 class RosterProfileVisitor(NodeVisitor):
@@ -44,6 +182,277 @@ class RosterProfileVisitor(NodeVisitor):
         return roster_profile.to_team(), roster_profile.release_date
 
 
+def _prepare_choices(choices: list[dict[str, str]]) -> tuple[list[str], list[dict[str, str]]]:
+    """
+    Normalizes the names of possible matches from `itscalledsoccer` once, so that they
+    need not be reprocessed for every comparison.
+
+    Args:
+        choices (list[dict[str, str]]): The list of possible matches from `itscalledsoccer`.
+
+    Returns:
+        tuple[list[str], list[dict[str, str]]]: The processed names, alongside the original choices.
+
+    """
+    return [utils.default_process(choice["Name"]) for choice in choices], choices
+
+
+def _explode_team_ids(team_ids: object) -> list:
+    """
+    Expands a `team_id` value from `itscalledsoccer`, which may be a single ID or a list-like of IDs, into a
+    list of IDs, like `explode` would. Empty list-likes are kept as a single missing team.
+
+    Args:
+        team_ids (object): A single team ID, or a list, tuple, or array of team IDs.
+
+    Returns:
+        list: The team IDs, or `[None]` if there are none.
+
+    """
+    # NOTE: The length is tested rather than the truth value, which is ambiguous for arrays of more than one element,
+    #       and would replace a single falsy ID with None
+    ids = list(team_ids) if isinstance(team_ids, list | tuple | np.ndarray) else [team_ids]
+    return ids if len(ids) else [None]
+
+
+def _get_grammar() -> Grammar:
+    """Returns the roster profile grammar, compiled once per process and version of the grammar file."""
+    return get_grammar(importlib.resources.files(__package__).joinpath("grammar.peg"))
+
+
+@functools.cache
+def _get_visitor() -> RosterProfileVisitor:
+    """Returns the roster profile visitor, which is stateless, created once per process."""
+    return RosterProfileVisitor()
+
+
+def _has_fonts(page: PageObject) -> bool:
+    """
+    Checks whether the page declares any font resources. Pages without fonts (e.g.,
+    scanned or image-only pages) cannot contain a roster profile, and so can be skipped
+    before the comparatively expensive text extraction.
+
+    Args:
+        page (PageObject): The page to inspect.
+
+    Returns:
+        bool: True if the page declares at least one font, False otherwise.
+
+    """
+    resources = page.get(Entry.RESOURCES)
+    return resources is not None and bool(resources.get(Entry.FONT))
+
+
+def _page_likely_has_roster(page: PageObject) -> bool:
+    """
+    Cheaply checks whether the page could contain a roster profile, by inspecting its
+    font resources and raw content stream before the comparatively expensive text
+    extraction. Pages without fonts, or whose content stream neither shows text nor
+    draws an external object which might, are ruled out.
+
+    The marker text itself cannot be searched for at this stage, as text-showing operators
+    split words at kerning adjustments (e.g., `[(S)-9 (ENIOR R)7 (O)8 (STER)]TJ`).
+
+    Args:
+        page (PageObject): The page to inspect.
+
+    Returns:
+        bool: False if the page certainly does not contain a roster profile, True otherwise.
+
+    """
+    if not _has_fonts(page):
+        return False
+
+    contents = page.get_contents()
+    return contents is not None and _TEXT_OPERATORS_PATTERN.search(contents.get_data()) is not None
+
+
+# NOTE: Below this many pages, parsing in the current process is faster than starting a pool of worker processes
+_MIN_PARALLEL_PAGES = 8
+
+_worker_sources: tuple[bytes | Path, ...] = ()
+_worker_documents: dict[int, tuple[PdfReader, list[PageObject]]] = {}
+
+
+def _open_pdf(source: bytes | Path) -> PdfReader:
+    """
+    Opens a PDF document for reading. Files are memory-mapped, so that their contents
+    are paged in on demand rather than read into memory up front.
+
+    Args:
+        source (bytes | Path): The raw contents of the PDF document, or the path to it.
+
+    Returns:
+        PdfReader: The reader for the PDF document.
+
+    """
+    if isinstance(source, bytes):
+        return PdfReader(io.BytesIO(source), strict=False)
+
+    with open(source, "rb") as f:
+        # NOTE: The mapping remains valid after the file is closed
+        return PdfReader(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), strict=False)
+
+
+def _init_worker(*sources: bytes | Path) -> None:
+    """
+    Initializes a worker process with the PDF documents to parse. Each worker opens its
+    own PDF readers, which cannot be shared across processes.
+
+    Args:
+        *sources (bytes | Path): The raw contents of each PDF document, or the path to it.
+
+    """
+    global _worker_sources
+    _worker_sources = sources
+    _worker_documents.clear()
+
+
+def _get_worker_document(doc_idx: int) -> tuple[PdfReader, list[PageObject]]:
+    """
+    Returns the reader and pages of a PDF document loaded by `_init_worker`, opening it on
+    first use. The page tree is traversed once per document, rather than once per page.
+
+    Args:
+        doc_idx (int): The zero-based index of the PDF document.
+
+    Returns:
+        tuple[PdfReader, list[PageObject]]: The reader for the PDF document and its pages.
+
+    """
+    if doc_idx not in _worker_documents:
+        pdf = _open_pdf(_worker_sources[doc_idx])
+        _worker_documents[doc_idx] = (pdf, list(pdf.pages))
+    return _worker_documents[doc_idx]
+
+
+class PageParseError(Exception):
+    """Exception raised when a page of a PDF document fails to parse, in place of the
+    original exception, which may not survive being sent back from a worker process
+    (e.g., parsimonious's `VisitationError`). Identifies the page and document, and
+    chains the original exception as the cause, where it is available."""
+
+    def __init__(self, source: str, page: int, error_type: str, message: str):
+        super().__init__(source, page, error_type, message)
+        self.source = source
+        self.page = page
+        self.error_type = error_type
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"Failed to parse page {self.page} of {self.source}: {self.error_type}: {self.message}"
+
+
+def _describe_source(doc_idx: int, source: bytes | Path) -> str:
+    """
+    Describes a PDF document for log messages and errors: its path, where it was given one, or otherwise its
+    one-based position in the batch (e.g., "document 2").
+
+    Args:
+        doc_idx (int): The zero-based index of the PDF document.
+        source (bytes | Path): The raw contents of the PDF document, or the path to it.
+
+    Returns:
+        str: The description of the PDF document.
+
+    """
+    if isinstance(source, Path):
+        return str(source)
+    return f"document {doc_idx + 1}"
+
+
+def _parse_page(doc_idx: int, idx: int) -> tuple[Team, datetime.date] | None:
+    """
+    Extracts and parses a single page of a PDF document loaded by `_init_worker`.
+
+    Log records emitted while parsing carry the document (see `_describe_source`) and one-based page number
+    in their `extra` dictionary, under "source" and "page", and any exception raised is replaced with a
+    `PageParseError` carrying both.
+
+    Args:
+        doc_idx (int): The zero-based index of the PDF document.
+        idx (int): The zero-based index of the page to parse.
+
+    Returns:
+        tuple[Team, datetime.date] | None: The parsed team and release date, or None if the page is not a
+            roster profile.
+
+    Raises:
+        PageParseError: If the page fails to parse, chained from the original exception.
+
+    """
+    source = _describe_source(doc_idx, _worker_sources[doc_idx])
+    with logger.contextualize(source=source, page=idx + 1):
+        try:
+            pdf, pages = _get_worker_document(doc_idx)
+            _page = pages[idx]
+            if not _page_likely_has_roster(_page):
+                return None
+
+            page = Page(pdf, _page)
+            if not page.contains("SENIOR ROSTER"):
+                return None
+
+            text = page.extract_text()
+            text = RosterProfileRelease._postprocess_text(text)
+
+            if "SENIOR ROSTER" not in text:
+                return None
+
+            tree = _get_grammar().parse(text)
+            return _get_visitor().serialize(tree)
+        except Exception as e:
+            # NOTE: Arbitrary exceptions may not pickle (or unpickle) cleanly, or keep their notes when they do, so
+            #       they are replaced with one built only from the page number and strings, which always arrives intact
+            #       from a worker process
+            raise PageParseError(source, idx + 1, type(e).__name__, str(e)) from e
+
+
+def _iter_parsed_pages(
+    sources: list[bytes | Path],
+    tasks: list[tuple[int, int]],
+    max_workers: int | None,
+) -> Iterator[tuple[Team, datetime.date] | None]:
+    """
+    Parses the given pages of the PDF documents, yielding the results in the order of the tasks.
+
+    Pages are parsed in a pool of worker processes, unless a single worker is requested, there are too few
+    pages for the start-up cost of the pool to pay off, or the current process is daemonic (e.g., a
+    `multiprocessing` or Celery worker) and so cannot start child processes. Otherwise, pages are parsed
+    in the current process.
+
+    Args:
+        sources (list[bytes | Path]): The raw contents of each PDF document, or the path to it.
+        tasks (list[tuple[int, int]]): The zero-based indices of each PDF document and page to parse.
+        max_workers (int | None): The maximum number of worker processes. Defaults to the number of CPUs.
+
+    Yields:
+        tuple[Team, datetime.date] | None: The parsed team and release date, or None if the page is not a
+            roster profile.
+
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) < _MIN_PARALLEL_PAGES or multiprocessing.current_process().daemon:
+        _init_worker(*sources)
+        try:
+            for doc_idx, idx in tasks:
+                yield _parse_page(doc_idx, idx)
+        finally:
+            _init_worker()
+        return
+
+    # Compile the grammar and create the visitor before starting the workers, so that forked processes
+    # inherit them
+    _get_grammar()
+    _get_visitor()
+
+    doc_idxs, idxs = zip(*tasks, strict=True)
+    chunksize = max(1, len(tasks) // (4 * workers))
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=tuple(sources)) as executor:
+        yield from executor.map(_parse_page, doc_idxs, idxs, chunksize=chunksize)
+
+
 class RosterProfileRelease(BaseModel):
     """
     Represents the release of a roster profile, including the release date and
@@ -76,39 +485,59 @@ class RosterProfileRelease(BaseModel):
             str: The post-processed text.
 
         """
-        return re.sub(rf"-{DelimiterGlyph.ATTRIBUTES_OPEN}.*{DelimiterGlyph.ATTRIBUTES_CLOSE}\n", "", text)
+        return _HYPHENATED_ATTRIBUTES_PATTERN.sub("", text)
 
     @staticmethod
-    def _itscalledsoccer_teams(client: AmericanSoccerAnalysis) -> list[dict[str, str]]:
+    @functools.lru_cache(maxsize=1)
+    def _itscalledsoccer_teams(as_of: datetime.date) -> list[dict[str, str]]:
         """
         Fetches Major League Soccer teams from `itscalledsoccer`.
 
+        Results are cached in memory and on disk, keyed by date, so repeated calls on the same day
+        do not refetch from the network.
+
         Args:
-            client (AmericanSoccerAnalysis): The `itscalledsoccer` client instance.
+            as_of (datetime.date): The date for which to fetch (or reuse) the teams.
 
         Returns:
             list[dict[str, str]]: A list of dictionaries representing the teams.
 
         """
+        cached = _read_cache("teams", as_of)
+        if cached is not None:
+            return cached
+
+        client = _get_asa_client()
         teams = client.get_teams(leagues="mls")
 
         teams = teams[["team_id", "team_name"]]
         teams.columns = ["ID", "Name"]
 
-        return teams.to_dict(orient="records")
+        records = teams.to_dict(orient="records")
+        _write_cache("teams", as_of, records)
+        return records
 
     @staticmethod
-    def _itscalledsoccer_players(client: AmericanSoccerAnalysis) -> list[dict[str, str]]:
+    @functools.lru_cache(maxsize=1)
+    def _itscalledsoccer_players(as_of: datetime.date) -> list[dict[str, str]]:
         """
         Fetches Major League Soccer players from `itscalledsoccer`.
 
+        Results are cached in memory and on disk, keyed by date, so repeated calls on the same day
+        do not refetch from the network.
+
         Args:
-            client (AmericanSoccerAnalysis): The `itscalledsoccer` client instance.
+            as_of (datetime.date): The date for which to fetch (or reuse) the players.
 
         Returns:
             list[dict[str, str]]: A list of dictionaries representing the players.
 
         """
+        cached = _read_cache("players", as_of)
+        if cached is not None:
+            return cached
+
+        client = _get_asa_client()
         teams = client.get_teams(leagues=["mls", "mlsnp"])
         teams = teams[["team_id", "team_name"]]
 
@@ -116,12 +545,19 @@ class RosterProfileRelease(BaseModel):
         players = players[["player_id", "player_name", "birth_date", "nationality", "season_name"]]
         players = players.explode("season_name", ignore_index=True).query("season_name >= '2023'")
 
-        seasons = [str(year) for year in range(2023, datetime.date.today().year + 1)]
+        seasons = [str(year) for year in range(2023, as_of.year + 1)]
         xgoals = client.get_player_xgoals(leagues=["mls", "mlsnp"], season_name=seasons)
         salaries = client.get_player_salaries(leagues=["mls"], season_name=seasons)
 
-        player_teams = pd.concat([xgoals[["player_id", "team_id"]], salaries[["player_id", "team_id"]]])
-        player_teams = player_teams.explode("team_id", ignore_index=True).drop_duplicates()
+        player_teams = pd.DataFrame(
+            list({
+                (player_id, team_id)
+                for frame in (xgoals, salaries)
+                for player_id, team_ids in zip(frame["player_id"].to_numpy(), frame["team_id"].to_numpy(), strict=True)
+                for team_id in _explode_team_ids(team_ids)
+            }),
+            columns=["player_id", "team_id"],
+        )
 
         player_positions = xgoals[["player_id", "general_position"]]
         player_positions = player_positions.explode("general_position", ignore_index=True).drop_duplicates()
@@ -131,18 +567,29 @@ class RosterProfileRelease(BaseModel):
         players = players.merge(player_positions, on="player_id", how="left")
         players = players.fillna("")
 
-        players["birth_date"] = players["birth_date"].apply(
-            lambda x: datetime.datetime.strptime(x, "%Y-%m-%d").strftime("%B %-d, %Y") if x else x
+        players["birth_date"] = (
+            pd.to_datetime(players["birth_date"], format="%Y-%m-%d", errors="coerce")
+            .dt.strftime("%B %-d, %Y")
+            .fillna("")
         )
-        players = players.groupby(["player_id", "player_name", "birth_date", "nationality"], as_index=False).agg({
-            "team_name": lambda x: ", ".join(sorted(set(x.dropna()))),
-            "general_position": lambda x: ", ".join(sorted(set(x.dropna()))),
-        })
+
+        keys = ["player_id", "player_name", "birth_date", "nationality"]
+        team_names, general_positions = (
+            players[[*keys, column]]
+            .drop_duplicates()
+            .sort_values(column, kind="stable")
+            .groupby(keys, as_index=False)[column]
+            .agg(", ".join)
+            for column in ["team_name", "general_position"]
+        )
+        players = team_names.merge(general_positions, on=keys)
 
         players = players[["player_id", "player_name", "team_name", "general_position", "birth_date", "nationality"]]
         players.columns = ["ID", "Name", "Team(s)", "Position(s)", "Birth Date", "Nationality"]
 
-        return players.to_dict(orient="records")
+        records = players.to_dict(orient="records")
+        _write_cache("players", as_of, records)
+        return records
 
     @staticmethod
     def _console_label(
@@ -191,10 +638,92 @@ class RosterProfileRelease(BaseModel):
         if user_input.lower() in ["y", "yes"]:
             return from_itscalledsoccer
 
+    @staticmethod
+    def _score_matches(names: list[str], processed_choices: list[str], score_cutoff: int) -> np.ndarray:
+        """
+        Scores every name against every possible match from `itscalledsoccer` in a
+        single batch, spread across all available CPU cores.
+
+        Args:
+            names (list[str]): The team or player names to score.
+            processed_choices (list[str]): The processed names of possible matches, as returned by `_prepare_choices`.
+            score_cutoff (int): The minimum score required to consider a match valid. Lower scores are set to 0.
+
+        Returns:
+            np.ndarray: A matrix of scores, with one row per name and one column per choice. Scores are kept
+                as unrounded `float32`, so that near-tied candidates are ordered by their exact scores.
+
+        """
+        return process.cdist(
+            [utils.default_process(name) for name in names],
+            processed_choices,
+            scorer=fuzz.WRatio,
+            score_cutoff=score_cutoff,
+            processor=None,
+            workers=-1,
+            dtype=np.float32,
+        )
+
+    @staticmethod
+    def _extract_matches(
+        scores: np.ndarray,
+        choices: list[dict[str, str]],
+        score_cutoff: int,
+        limit: int = 5,
+    ) -> list[tuple[str, float, int]]:
+        """
+        Selects the best matches from a row of scores, mirroring the output of
+        `rapidfuzz.process.extract`.
+
+        Args:
+            scores (np.ndarray): The scores of a single name against each of the choices.
+            choices (list[dict[str, str]]): The list of possible matches from `itscalledsoccer`.
+            score_cutoff (int): The minimum score required to consider a match valid.
+            limit (int): The maximum number of matches to return.
+
+        Returns:
+            list[tuple[str, float, int]]: The matching names, scores, and indices, sorted by descending score.
+
+        """
+        indices = np.flatnonzero(scores >= score_cutoff)
+        indices = indices[np.argsort(-scores[indices], kind="stable")][:limit]
+        return [(choices[idx]["Name"], float(scores[idx]), int(idx)) for idx in indices]
+
+    @staticmethod
+    def _exact_matches(
+        names: list[str],
+        exact_index: dict[str, int],
+        choices: list[dict[str, str]],
+        team_name: str,
+    ) -> list[int | None]:
+        """
+        Identifies the players whose processed names exactly match a possible match from
+        `itscalledsoccer` that has played for the given team, so that they need not be scored.
+
+        An exact match scores 100, so where the first such choice has played for the team, it is
+        the one `_map_id` would select regardless of any other matches.
+
+        Args:
+            names (list[str]): The player names to match.
+            exact_index (dict[str, int]): The index of the first choice with each processed name.
+            choices (list[dict[str, str]]): The list of possible matches from `itscalledsoccer`.
+            team_name (str): The name of the team to which the players belong.
+
+        Returns:
+            list[int | None]: The index of the exactly matching choice for each name, or None if there is none.
+
+        """
+        matches = []
+        for name in names:
+            idx = exact_index.get(utils.default_process(name))
+            matches.append(idx if idx is not None and team_name in choices[idx]["Team(s)"] else None)
+        return matches
+
     @staticmethod
     def _map_id(
         entity: Team | Player,
         choices: list[dict[str, str]],
+        scores: np.ndarray,
         score_cutoff: int,
         team_name: str | None = None,
     ) -> Team | Player:
@@ -205,6 +734,7 @@ class RosterProfileRelease(BaseModel):
         Args:
             entity (Team | Player): The team or player entity to map.
             choices (list[dict[str, str]]): The list of possible matches from `itscalledsoccer`.
+            scores (np.ndarray): The scores of the entity's name against each of the choices.
             score_cutoff (int): The minimum score required to consider a match valid.
             team_name (str | None): The name of the team to which the player belongs, where applicable.
 
@@ -219,14 +749,7 @@ class RosterProfileRelease(BaseModel):
             entity_type = "player"
             from_roster_profile = {"Name": entity.name, "Team": team_name}
 
-        matches = process.extract(
-            entity.name,
-            [choice["Name"] for choice in choices],
-            scorer=fuzz.WRatio,
-            score_cutoff=score_cutoff,
-            processor=utils.default_process,
-        )
-
+        matches = RosterProfileRelease._extract_matches(scores, choices, score_cutoff)
         if len(matches) == 1 or (
             len(matches) > 1
             and matches[0][1] == 100
@@ -268,29 +791,62 @@ class RosterProfileRelease(BaseModel):
         """
         logger.info("Mapping team and player names to their IDs, retrieving data from `itscalledsoccer`...")
 
-        asa_client = AmericanSoccerAnalysis()
-        itscalledsoccer_teams = RosterProfileRelease._itscalledsoccer_teams(asa_client)
-        itscalledsoccer_players = RosterProfileRelease._itscalledsoccer_players(asa_client)
+        today = datetime.date.today()
+        processed_teams, itscalledsoccer_teams = _prepare_choices(RosterProfileRelease._itscalledsoccer_teams(today))
+        processed_players, itscalledsoccer_players = _prepare_choices(
+            RosterProfileRelease._itscalledsoccer_players(today)
+        )
 
         logger.info("Successfully retrieved data from `itscalledsoccer`")
 
-        for team in teams:
-            logger.info(f"[{team.name}] Mapping team and player names to their IDs")
+        team_cutoff, player_cutoff = 86, 75
+        team_scores = RosterProfileRelease._score_matches(
+            [team.name for team in teams],
+            processed_teams,
+            score_cutoff=team_cutoff,
+        )
+
+        exact_players = {}
+        for idx, name in enumerate(processed_players):
+            exact_players.setdefault(name, idx)
+
+        for team, scores in zip(teams, team_scores, strict=True):
+            logger.info("[{}] Mapping team and player names to their IDs", team.name)
 
             team = RosterProfileRelease._map_id(
                 entity=team,
                 choices=itscalledsoccer_teams,
-                score_cutoff=86,
+                scores=scores,
+                score_cutoff=team_cutoff,
             )
 
-            players = []
-            for player in team.players:
-                player = RosterProfileRelease._map_id(
-                    entity=player,
-                    choices=itscalledsoccer_players,
-                    score_cutoff=75,
-                    team_name=team.name,
+            exact_matches = RosterProfileRelease._exact_matches(
+                [player.name for player in team.players],
+                exact_players,
+                itscalledsoccer_players,
+                team_name=team.name,
+            )
+            player_scores = iter(
+                RosterProfileRelease._score_matches(
+                    [player.name for player, idx in zip(team.players, exact_matches, strict=True) if idx is None],
+                    processed_players,
+                    score_cutoff=player_cutoff,
                 )
+            )
+
+            players = []
+            for player, idx in zip(team.players, exact_matches, strict=True):
+                if idx is not None:
+                    player.id_ = itscalledsoccer_players[idx]["ID"]
+                    player.name = itscalledsoccer_players[idx]["Name"]
+                else:
+                    player = RosterProfileRelease._map_id(
+                        entity=player,
+                        choices=itscalledsoccer_players,
+                        scores=next(player_scores),
+                        score_cutoff=player_cutoff,
+                        team_name=team.name,
+                    )
 
                 if player.id_ and sum(p.id_ == player.id_ for p in team.players) > 1:
                     logger.warning(f"[{team.name}] {player.name} appears multiple times, removing duplicate entry")
@@ -304,7 +860,7 @@ class RosterProfileRelease(BaseModel):
         return teams
 
     @classmethod
-    def from_pdf(cls, stream: str | bytes | Path) -> RosterProfileRelease:
+    def from_pdf(cls, stream: str | bytes | Path, max_workers: int | None = None) -> RosterProfileRelease:
         """
         Parses a PDF document, extracts the enclosed roster profiles, and returns a
         JSON-like structure.
@@ -317,36 +873,86 @@ class RosterProfileRelease(BaseModel):
         as well as when a player or team cannot be confidently mapped to an ID, highlighting sections of
         the output which may require manual review.
 
+        Pages are extracted and parsed in parallel across worker processes, except for short documents,
+        when `max_workers` is 1, or when called from a daemonic process, in which case they are parsed in
+        the current process. When given a path, each worker memory-maps the file rather than receiving a
+        copy of its contents. Where worker processes are started with "spawn" (the default on macOS and
+        Windows), the calling script must guard its entry point with `if __name__ == "__main__":`.
+
         Args:
             stream (str | bytes | Path): The PDF document to parse.
+            max_workers (int | None): The maximum number of worker processes. Defaults to the number of CPUs.
 
         Returns:
             RosterProfileRelease: The parsed roster profile release.
 
         """
-        pdf = PdfReader(stream)
+        return cls.from_pdfs([stream], max_workers=max_workers)[0]
+
+    @classmethod
+    def from_pdfs(
+        cls, streams: Iterable[str | bytes | Path], max_workers: int | None = None
+    ) -> list[RosterProfileRelease]:
+        """
+        Parses several PDF documents, as with `from_pdf`, returning one roster profile release per document.
 
-        rules = importlib.resources.files(__package__).joinpath("grammar.peg")
-        grammar = Grammar(rules)
+        The pages of all the documents are parsed in a single pool of worker processes (or in the current
+        process, under the same conditions as `from_pdf`), so that the workers are started (and the grammar
+        is compiled) once for the whole batch.
 
-        teams = []
-        release_date = None
+        Args:
+            streams (Iterable[str | bytes | Path]): The PDF documents to parse.
+            max_workers (int | None): The maximum number of worker processes. Defaults to the number of CPUs.
 
-        logger.info(f"Parsing PDF with {len(pdf.pages)} pages")
+        Returns:
+            list[RosterProfileRelease]: The parsed roster profile releases, in the order of the documents.
 
-        for idx, _page in enumerate(pdf.pages):
-            page = Page(pdf, _page)
-            text = page.extract_text()
-            text = cls._postprocess_text(text)
-
-            if "SENIOR ROSTER" in text:
-                tree = grammar.parse(text)
-                visitor = RosterProfileVisitor()
-                team, release_date = visitor.serialize(tree)
-                teams.append(team)
-                logger.info(f"[Page {idx + 1} of {len(pdf.pages)}] Parsed roster profile for '{team.name}'")
+        Raises:
+            PageParseError: If any page fails to parse.
+
+        """
+        sources = [cls._to_source(stream) for stream in streams]
+        num_pages = [len(_open_pdf(source).pages) for source in sources]
+        tasks = [(doc_idx, idx) for doc_idx, count in enumerate(num_pages) for idx in range(count)]
+
+        teams: list[list[Team]] = [[] for _ in sources]
+        release_dates: list[datetime.date | None] = [None for _ in sources]
+
+        logger.info("Parsing {} PDF(s) with {} pages", len(sources), len(tasks))
+
+        descriptions = [_describe_source(doc_idx, source) for doc_idx, source in enumerate(sources)]
+        results = _iter_parsed_pages(sources, tasks, max_workers)
+        for (doc_idx, idx), result in zip(tasks, results, strict=True):
+            source = descriptions[doc_idx]
+            if result is not None:
+                team, release_dates[doc_idx] = result
+                teams[doc_idx].append(team)
+                logger.info(
+                    "[{}, page {} of {}] Parsed roster profile for '{}'", source, idx + 1, num_pages[doc_idx], team.name
+                )
             else:
-                logger.info(f"[Page {idx + 1} of {len(pdf.pages)}] Skipped non-roster profile page")
+                logger.info("[{}, page {} of {}] Skipped non-roster profile page", source, idx + 1, num_pages[doc_idx])
+
+        return [
+            cls(release_date=release_date, teams=cls._map_ids(doc_teams))
+            for doc_teams, release_date in zip(teams, release_dates, strict=True)
+        ]
+
+    @staticmethod
+    def _to_source(stream: str | bytes | Path) -> bytes | Path:
+        """
+        Normalizes a PDF document to the form handed to the worker processes: a path for files,
+        which workers memory-map, or otherwise the raw contents.
+
+        Args:
+            stream (str | bytes | Path): The PDF document, its path, or a readable binary stream.
 
-        teams = cls._map_ids(teams)
-        return cls(release_date=release_date, teams=teams)
+        Returns:
+            bytes | Path: The path to the PDF document, or its raw contents.
+
+        """
+        if isinstance(stream, str | Path):
+            return Path(stream)
+        if isinstance(stream, bytes):
+            return stream
+        return stream.read()
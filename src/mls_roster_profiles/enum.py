@@ -1,22 +1,35 @@
-import re
 from enum import StrEnum
+from typing import Self
+
+# NOTE: Removes en dashes, hyphens, and whitespace (i.e., the characters for which `str.isspace` is True,
+#       matching `\s` in regular expressions, all of which precede U+3001)
+_PROCESS_VALUE_TABLE = str.maketrans("", "", "–-" + "".join(c for c in map(chr, range(0x3001)) if c.isspace()))  # noqa: RUF001
 
 
 class StrEnumCaseInsensitive(StrEnum):
     """A case-, space-, and hyphen-insensitive string enumeration."""
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # NOTE: Members are already defined by the time `__init_subclass__` is called
+        cls._normalized = {cls._process_value(member.value): member for member in cls}
+
     @staticmethod
     def _process_value(value: str) -> str:
-        return re.sub(r"–|-|\s", "", value.lower())  # noqa: RUF001
+        return value.lower().translate(_PROCESS_VALUE_TABLE)
 
     @classmethod
-    def _missing_(cls, value: str):
-        lower_value = cls._process_value(value)
-        for member in cls:
-            if cls._process_value(member.value) == lower_value:
-                return member
+    def get(cls, value: object) -> Self | None:
+        """Returns the member matching the provided value, or None if there is no such member."""
+        if isinstance(value, str):
+            return cls._normalized.get(cls._process_value(value))
         return None
 
+    @classmethod
+    def _missing_(cls, value: object):
+        # NOTE: Only called when `value` is not an exact member value
+        return cls.get(value)
+
 
 class RosterSlot(StrEnumCaseInsensitive):
     """Enumerator for roster slots in Major League Soccer."""
@@ -1,11 +1,50 @@
 import datetime
 import re
-from typing import Annotated
+from collections.abc import Callable, Iterator
+from functools import cached_property
+from typing import Annotated, ClassVar
 
 from loguru import logger
 from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
 
-from mls_roster_profiles.enum import CurrentStatus, RosterConstructionModel, RosterDesignation, RosterSlot
+from mls_roster_profiles.enum import (
+    CurrentStatus,
+    RosterConstructionModel,
+    RosterDesignation,
+    RosterSlot,
+    StrEnumCaseInsensitive,
+)
+
+_DIGITS_PATTERN = re.compile(r"\d+")
+
+
+def _coerce_enum(
+    enum_class: type[StrEnumCaseInsensitive],
+    value: str | None,
+    label: str,
+) -> StrEnumCaseInsensitive | str | None:
+    """
+    Coerces a value to the matching member of a case-insensitive enumeration, logging a
+    warning and returning the value as is if there is no such member.
+
+    Args:
+        enum_class (type[StrEnumCaseInsensitive]): The enumeration to coerce the value to.
+        value (str | None): The value to coerce.
+        label (str): A description of the value, for the warning message.
+
+    Returns:
+        StrEnumCaseInsensitive | str | None: The matching member, the unrecognized value, or None if empty.
+
+    """
+    if not value:
+        return None
+
+    member = enum_class.get(value)
+    if member is None:
+        logger.warning(f"Unrecognized {label}: '{value}'. Returning as string.")
+        return value
+
+    return member
 
 
 class Player(BaseModel):
@@ -83,24 +122,12 @@ class Player(BaseModel):
     @field_validator("roster_designation", mode="before")
     @classmethod
     def validate_roster_designation(cls, value: str | None) -> RosterDesignation | str | None:
-        if value:
-            try:
-                return RosterDesignation(value)
-            except ValueError:
-                logger.warning(f"Unrecognized roster designation: '{value}'. Returning as string.")
-                return value
-        return None
+        return _coerce_enum(RosterDesignation, value, "roster designation")
 
     @field_validator("current_status", mode="before")
     @classmethod
-    def validate_current_status(cls, value: str | None) -> CurrentStatus | None:
-        if value:
-            try:
-                return CurrentStatus(value)
-            except ValueError:
-                logger.warning(f"Unrecognized current status: '{value}'. Returning as string.")
-                return value
-        return None
+    def validate_current_status(cls, value: str | None) -> CurrentStatus | str | None:
+        return _coerce_enum(CurrentStatus, value, "current status")
 
 
 class Team(BaseModel):
@@ -148,13 +175,7 @@ class Team(BaseModel):
     @field_validator("roster_construction_model", mode="before")
     @classmethod
     def validate_roster_construction_model(cls, value: str | None) -> RosterConstructionModel | str | None:
-        if value:
-            try:
-                return RosterConstructionModel(value)
-            except ValueError:
-                logger.warning(f"Unrecognized roster construction model: '{value}'. Returning as string.")
-                return value
-        return None
+        return _coerce_enum(RosterConstructionModel, value, "roster construction model")
 
 
 class TableTitleMixin(BaseModel):
@@ -162,6 +183,17 @@ class TableTitleMixin(BaseModel):
 
     title: str = Field(validation_alias="table_title")
 
+    @cached_property
+    def title_lower(self) -> str:
+        """
+        The lowercased title of the table. Computed once per table.
+
+        Returns:
+            str: The lowercased title.
+
+        """
+        return self.title.lower()
+
 
 class SmallTableRow(BaseModel):
     """Represents a row in a small table, specifiying which players occupy a team's
@@ -176,6 +208,18 @@ class SmallTable(TableTitleMixin):
 
     rows: list[SmallTableRow] = Field(default_factory=list, validation_alias="small_table_row")
 
+    @cached_property
+    def normalized_rows(self) -> list[tuple[str, str]]:
+        """
+        The player names of the rows with one, alongside their lowercased counterparts.
+        Computed once per table.
+
+        Returns:
+            list[tuple[str, str]]: The player names and lowercased player names, in the table's order.
+
+        """
+        return [(row.player_name, row.player_name.lower()) for row in self.rows if row.player_name is not None]
+
 
 class LargeTableRow(BaseModel):
     """Represents a row in a large table, specifying each rostered player's designation,
@@ -195,6 +239,24 @@ class LargeTable(TableTitleMixin):
     rows: list[LargeTableRow] = Field(default_factory=list, validation_alias="large_table_row")
 
 
+def _players_matching(name_lower: str, players_by_name: dict[str, list[Player]]) -> Iterator[Player]:
+    """
+    Finds the players whose lowercased name is a prefix of the provided lowercased name
+    from a small table (e.g., "Lionel Messi" for "Lionel Messi^"), by looking up each of its
+    prefixes.
+
+    Args:
+        name_lower (str): The lowercased player name from the small table.
+        players_by_name (dict[str, list[Player]]): The players, keyed by their lowercased name.
+
+    Yields:
+        Player: The matching players.
+
+    """
+    for end in range(len(name_lower) + 1):
+        yield from players_by_name.get(name_lower[:end], ())
+
+
 class RosterProfile(BaseModel):
     """Represents a roster profile for a single Major League Soccer team."""
 
@@ -205,110 +267,138 @@ class RosterProfile(BaseModel):
     small_tables: list[SmallTable] = Field(default_factory=list, validation_alias="small_table")
     large_tables: list[LargeTable] = Field(default_factory=list, validation_alias="large_table")
 
-    def _get_international_slots(self) -> int | None:
+    def _get_international_slots(self, small_tables: dict[str, list[SmallTable]]) -> int | None:
         """
         From the relevant table title, extract the number of international slots the
         team possesses.
 
+        Args:
+            small_tables (dict[str, list[SmallTable]]): The small tables, as classified by
+                `_classify_small_tables`.
+
         Returns:
             int | None: The number of international slots, or None if not found.
 
         """
-        for table in self.small_tables:
-            if table.title.lower().startswith("international"):
-                match = re.search(r"\d+", table.title)
-                if match:
-                    return int(match.group(0))
+        for table in small_tables["international"]:
+            match = _DIGITS_PATTERN.search(table.title)
+            if match:
+                return int(match.group(0))
 
-    def _enrich_from_international_slots(self, player: Player) -> Player:
+    @staticmethod
+    def _enrich_from_international_slots(table: SmallTable, players_by_name: dict[str, list[Player]]) -> None:
         """
-        Enriches the player object with details found in the "International Slots"
-        table.
+        Enriches the player objects with details found in an "International Slots" table.
 
         Args:
-            player (Player): The player object to enrich.
-
-        Returns:
-            Player: The enriched player object.
+            table (SmallTable): The "International Slots" table.
+            players_by_name (dict[str, list[Player]]): The player objects, keyed by their lowercased name.
 
         """
-        for table in self.small_tables:
-            if table.title.lower().startswith("international"):
-                if any("+" in str(row.player_name) for row in table.rows):
+        if any("+" in row_name for row_name, _ in table.normalized_rows):
+            for players in players_by_name.values():
+                for player in players:
                     player.canadian_international_slot_exemption = False
 
-                for row in table.rows:
-                    if str(row.player_name).lower().startswith(player.name.lower()):
-                        player.international_slot = True
-                        if "+" in row.player_name:
-                            player.canadian_international_slot_exemption = True
-                        break
-        return player
-
-    def _enrich_from_designated_players(self, player: Player) -> Player:
+        # NOTE: A player's first match in the table takes precedence
+        matched = set()
+        for row_name, row_name_lower in table.normalized_rows:
+            for player in _players_matching(row_name_lower, players_by_name):
+                if id(player) not in matched:
+                    matched.add(id(player))
+                    player.international_slot = True
+                    if "+" in row_name:
+                        player.canadian_international_slot_exemption = True
+
+    @staticmethod
+    def _enrich_from_designated_players(table: SmallTable, players_by_name: dict[str, list[Player]]) -> None:
         """
-        Enriches the player object with details found in the "Designated Players" table.
+        Enriches the player objects with details found in a "Designated Players" table.
 
         Args:
-            player (Player): The player object to enrich.
-
-        Returns:
-            Player: The enriched player object.
+            table (SmallTable): The "Designated Players" table.
+            players_by_name (dict[str, list[Player]]): The player objects, keyed by their lowercased name.
 
         """
-        if player.roster_designation == RosterDesignation.DP:
-            player.convertible_with_tam = True
-            for table in self.small_tables:
-                if table.title.lower().startswith("designated"):
-                    for row in table.rows:
-                        if str(row.player_name).lower().startswith(player.name.lower()) and "^" in row.player_name:
-                            player.convertible_with_tam = False
-        return player
-
-    def _enrich_from_unavailable_players(self, player: Player) -> Player:
+        for row_name, row_name_lower in table.normalized_rows:
+            if "^" in row_name:
+                for player in _players_matching(row_name_lower, players_by_name):
+                    if player.roster_designation == RosterDesignation.DP:
+                        player.convertible_with_tam = False
+
+    @staticmethod
+    def _enrich_from_unavailable_players(table: SmallTable, players_by_name: dict[str, list[Player]]) -> None:
         """
-        Enriches the player object with details found in the "Unavailable Players"
-        table.
+        Enriches the player objects with details found in an "Unavailable Players" table.
 
         Args:
-            player (Player): The player object to enrich.
-
-        Returns:
-            Player: The enriched player object.
+            table (SmallTable): The "Unavailable Players" table.
+            players_by_name (dict[str, list[Player]]): The player objects, keyed by their lowercased name.
 
         """
-        for table in self.small_tables:
-            if table.title.lower().startswith("unavailable"):
-                for row in table.rows:
-                    if str(row.player_name).lower().startswith(player.name.lower()):
-                        player.unavailable = True
-        return player
-
-    def _enrich_player(self, player: Player) -> Player:
+        for _, row_name_lower in table.normalized_rows:
+            for player in _players_matching(row_name_lower, players_by_name):
+                player.unavailable = True
+
+    # NOTE: Small tables are classified by the first word of their title
+    _small_table_enrichers: ClassVar[dict[str, Callable[[SmallTable, dict[str, list[Player]]], None]]] = {
+        "international": _enrich_from_international_slots,
+        "designated": _enrich_from_designated_players,
+        "unavailable": _enrich_from_unavailable_players,
+    }
+
+    def _enrich_players(self, players: list[Player], small_tables: dict[str, list[SmallTable]]) -> None:
         """
-        Enriches the player object with details from various small tables.
+        Enriches the player objects with details found in the "International Slots",
+        "Designated Players", and "Unavailable Players" tables, in a single pass over each
+        table's rows.
 
         Args:
-            player (Player): The player object to enrich.
+            players (list[Player]): The player objects to enrich.
+            small_tables (dict[str, list[SmallTable]]): The small tables, as classified by
+                `_classify_small_tables`.
 
-        Returns:
-            Player: The enriched player object.
+        """
+        players_by_name = {}
+        for player in players:
+            players_by_name.setdefault(player.name.lower(), []).append(player)
+
+            if player.roster_designation == RosterDesignation.DP:
+                player.convertible_with_tam = True
+
+            if player.current_status != CurrentStatus.LOAN_PLAYER:
+                player.permanent_transfer_option = None
 
+        for category, tables in small_tables.items():
+            enrich = self._small_table_enrichers[category]
+            for table in tables:
+                enrich(table, players_by_name)
+
+    def _classify_small_tables(self) -> dict[str, list[SmallTable]]:
         """
-        player = self._enrich_from_international_slots(player)
-        player = self._enrich_from_designated_players(player)
-        player = self._enrich_from_unavailable_players(player)
+        Classifies the small tables by the first word of their title (i.e., "international",
+        "designated", or "unavailable"), so that the enrichment of players need not inspect
+        every table title. Tables of any other category are ignored.
 
-        player.permanent_transfer_option = (
-            player.permanent_transfer_option if player.current_status == CurrentStatus.LOAN_PLAYER else None
-        )
+        Returns:
+            dict[str, list[SmallTable]]: For each category, the matching small tables.
 
-        return player
+        """
+        small_tables = {category: [] for category in self._small_table_enrichers}
+        for table in self.small_tables:
+            category = (table.title_lower.split(maxsplit=1) or [""])[0]
+            if category in small_tables:
+                small_tables[category].append(table)
+        return small_tables
 
-    def _get_players(self) -> list[Player]:
+    def _get_players(self, small_tables: dict[str, list[SmallTable]]) -> list[Player]:
         """
-        Extracts player information from the large tables and enriches each player
-        object with details from various small tables.
+        Extracts player information from the large tables and then enriches the player
+        objects with details from various small tables.
+
+        Args:
+            small_tables (dict[str, list[SmallTable]]): The small tables, as classified by
+                `_classify_small_tables`.
 
         Returns:
             list[Player]: The list of extracted players.
@@ -316,20 +406,21 @@ class RosterProfile(BaseModel):
         """
         players = []
         for table in self.large_tables:
+            roster_slot = RosterSlot(table.title)
             for row in table.rows:
-                permanent_transfer_option = str(row.option_years).startswith("PT")
+                permanent_transfer_option = row.option_years is not None and row.option_years.startswith("PT")
                 player = Player(
                     name=row.player_name,
-                    roster_slot=table.title,
+                    roster_slot=roster_slot,
                     roster_designation=row.roster_designation,
                     current_status=row.current_status,
                     contract_through=row.contract_through,
                     option_years=row.option_years,
                     permanent_transfer_option=permanent_transfer_option,
                 )
-                player = self._enrich_player(player)
                 players.append(player)
 
+        self._enrich_players(players, small_tables)
         return players
 
     def to_team(self) -> Team:
@@ -340,8 +431,9 @@ class RosterProfile(BaseModel):
             Team: The constructed team object.
 
         """
-        international_slots = self._get_international_slots()
-        players = self._get_players()
+        small_tables = self._classify_small_tables()
+        international_slots = self._get_international_slots(small_tables)
+        players = self._get_players(small_tables)
 
         return Team(
             name=self.team_name,
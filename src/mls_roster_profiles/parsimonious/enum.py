@@ -0,0 +1,13 @@
+from enum import IntEnum, auto
+
+
+class FieldKind(IntEnum):
+    """Enumerator for the kinds of Pydantic model fields recognized by the custom `NodeVisitor`."""
+
+    STR = auto()
+    DATE = auto()
+    INT = auto()
+    LIST_OF_MODEL = auto()
+    MODEL = auto()
+    LIST = auto()
+    UNSUPPORTED = auto()
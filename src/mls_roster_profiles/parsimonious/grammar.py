@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 
 from parsimonious.grammar import Grammar as ParsimoniousGrammar
@@ -45,3 +46,25 @@ class Grammar(ParsimoniousGrammar):
             rules_content += _BASE_RULES
 
         super().__init__(rules_content)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_grammar(rules: str, mtime_ns: int) -> Grammar:
+    """Compiles the grammar for a rules file, once per version (i.e., modification time) of the file."""
+    return Grammar(Path(rules))
+
+
+def get_grammar(rules: Path) -> Grammar:
+    """
+    Returns the grammar for the provided PEG grammar file, compiling it only if the file
+    has not already been compiled in its current version.
+
+    Args:
+        rules (Path): The path to the PEG grammar file.
+
+    Returns:
+        Grammar: The compiled grammar.
+
+    """
+    rules = Path(rules)
+    return _build_grammar(str(rules), rules.stat().st_mtime_ns)
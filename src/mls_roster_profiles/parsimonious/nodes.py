@@ -1,15 +1,23 @@
 import datetime
-from collections.abc import Iterable
+import functools
+from collections.abc import Callable, Iterator
 from enum import StrEnum
 from types import NoneType, UnionType
 from typing import Any, Literal, Union, get_args, get_origin
 
 from dateutil import parser as date_parser
 from loguru import logger
+from parsimonious.exceptions import UndefinedLabel, VisitationError
 from parsimonious.nodes import Node
 from parsimonious.nodes import NodeVisitor as ParsimoniousNodeVisitor
 from pydantic import BaseModel
 
+from mls_roster_profiles.parsimonious.enum import FieldKind
+
+# NOTE: Date formats found in the roster profile releases (e.g., 'May 1, 2025'), tried before falling back to the
+#       more lenient (and considerably slower) `dateutil` parser
+_DATE_FORMATS = ("%B %d, %Y", "%b %d, %Y")
+
 
 class BaseModelNotFoundError(Exception):
     """Exception raised when a `BaseModel` class is not found or is invalid, in the
@@ -26,8 +34,7 @@ class NodeVisitor(ParsimoniousNodeVisitor):
     annotations of a provided Pydantic `BaseModel` class.
 
     For terminal nodes (e.g., strings, enum values, integers, dates, etc.), the visitor method
-    simply returns a dictionary with a single key-value pair, representing the attribute name
-    and its extracted value, respectively.
+    simply returns a tuple pairing the attribute name with its extracted value.
 
     For nested structures, or lists of nested structures, this method traverses these until
     reaching all terminal nodes and then continues onto the next attribute. These structures are
@@ -46,41 +53,56 @@ class NodeVisitor(ParsimoniousNodeVisitor):
 
     model_class: BaseModel | None = None
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # NOTE: The visitor methods depend only on the model class, so they are installed once per subclass
+        if cls.model_class is not None:
+            cls._create_visitors(cls.model_class)
+            cls._add_model_visitor("root", cls.model_class, include_key=False)
+
     def __init__(self) -> None:
         super().__init__()
-        self._create_visitors(self.model_class)
-        self._add_model_visitor("root", self.model_class, include_key=False)
+        if self.model_class is None:
+            raise BaseModelNotFoundError
+        self._visit_table = {
+            name.removeprefix("visit_"): getattr(self, name) for name in dir(self) if name.startswith("visit_")
+        }
 
     @staticmethod
-    def _get_fields(model_class: BaseModel) -> Iterable[tuple[str, type]]:
+    @functools.cache
+    def _get_fields(model_class: BaseModel) -> tuple[tuple[str, type], ...]:
         """
         Get the fields of a Pydantic model class, including their names and types. This
         method handles both the `alias` and `validation_alias` attributes of the model
         fields, ensuring that the correct field names are used in the visitor methods.
 
+        The fields are inspected once per model class.
+
         Args:
             model_class (BaseModel): The Pydantic model class to inspect.
 
-        Yields:
-            tuple[str, type]: A tuple containing the field name and its type annotation.
+        Returns:
+            tuple[tuple[str, type], ...]: Tuples containing each field name and its type annotation.
 
         """
+        fields = []
         for field_name, field_info in model_class.model_fields.items():
             field_type = field_info.annotation
             if field_info.validation_alias:
                 field_name = field_info.validation_alias
             elif field_info.alias:
                 field_name = field_info.alias
-            yield field_name, field_type
+            fields.append((field_name, field_type))
+        return tuple(fields)
 
-    def _create_visitors(self, model_class: BaseModel) -> None:
+    @classmethod
+    def _create_visitors(cls, model_class: BaseModel) -> None:
         """
         Recursively create visitor methods for each field in the provided Pydantic model
         class.
 
         For terminal nodes (e.g., strings, enum values, integers, dates, etc.), the visitor method
-        simply returns a dictionary with a single key-value pair, representing the attribute name
-        and its extracted value, respectively.
+        simply returns a tuple pairing the attribute name with its extracted value.
 
         For nested structures, or lists of nested structures, this method traverses these until
         reaching all terminal nodes and then continues onto the next attribute. These structures are
@@ -98,30 +120,69 @@ class NodeVisitor(ParsimoniousNodeVisitor):
         if model_class is None or not issubclass(model_class, BaseModel):
             raise BaseModelNotFoundError
 
-        for field_name, field_type in self._get_fields(model_class):
-            if self._is_str(field_type):
-                self._add_str_visitor(field_name)
+        for field_name, field_type in cls._get_fields(model_class):
+            _FIELD_VISITOR_ADDERS[cls._classify(field_type)](cls, field_name, field_type)
+
+    @staticmethod
+    @functools.cache
+    def _classify(annotation: type) -> FieldKind:
+        """
+        Classify the provided field annotation into the kind of visitor method it requires.
+
+        The checks are ordered by precedence and run once per annotation.
+
+        Args:
+            annotation (type): The type annotation to classify.
+
+        Returns:
+            FieldKind: The kind of the field annotation.
+
+        """
+        if NodeVisitor._is_str(annotation):
+            return FieldKind.STR
+        if NodeVisitor._is_date(annotation):
+            return FieldKind.DATE
+        if NodeVisitor._is_int(annotation):
+            return FieldKind.INT
+        if NodeVisitor._is_list_of_model(annotation):
+            return FieldKind.LIST_OF_MODEL
+        if NodeVisitor._is_model(annotation):
+            return FieldKind.MODEL
+        if NodeVisitor._is_list(annotation):
+            return FieldKind.LIST
+        return FieldKind.UNSUPPORTED
+
+    @classmethod
+    def _add_list_of_model_visitors(cls, field_name: str, field_type: type) -> None:
+        child_type = get_args(field_type)[0]
+        cls._create_visitors(child_type)
+        cls._add_model_visitor(field_name, child_type)
 
-            elif self._is_date(field_type):
-                self._add_date_visitor(field_name)
+    @classmethod
+    def _add_nested_model_visitors(cls, field_name: str, field_type: type) -> None:
+        cls._add_model_visitor(field_name, field_type)
+        cls._create_visitors(field_type)
 
-            elif self._is_int(field_type):
-                self._add_int_visitor(field_name)
+    @staticmethod
+    def _warn_unsupported_field(field_name: str, field_type: type) -> None:
+        logger.warning(f"Unsupported type for field `{field_name}`: {field_type}")
 
-            elif self._is_list_of_model(field_type):
-                child_type = get_args(field_type)[0]
-                self._create_visitors(child_type)
-                self._add_model_visitor(field_name, child_type)
+    @staticmethod
+    @functools.cache
+    def _union_args(annotation: type) -> tuple[type, ...] | None:
+        """
+        Get the arguments of the provided field annotation if it is a union, once per annotation.
 
-            elif self._is_model(field_type):
-                self._add_model_visitor(field_name, field_type)
-                self._create_visitors(field_type)
+        Args:
+            annotation (type): The type annotation to inspect.
 
-            elif self._is_list(field_type):
-                self._add_list_visitor(field_name, field_type)
+        Returns:
+            tuple[type, ...] | None: The arguments of the union, or None if the annotation is not a union.
 
-            else:
-                logger.warning(f"Unsupported type for field `{field_name}`: {field_type}")
+        """
+        if isinstance(annotation, UnionType) or get_origin(annotation) is Union:
+            return get_args(annotation)
+        return None
 
     @staticmethod
     def _is_str(annotation: type) -> bool:
@@ -138,17 +199,28 @@ class NodeVisitor(ParsimoniousNodeVisitor):
         """
         if annotation is str:
             return True
-        if isinstance(annotation, UnionType) or get_origin(annotation) is Union:
-            args = get_args(annotation)
-            if all(
-                arg is str
-                or arg is NoneType
-                or (get_origin(arg) is Literal and all(isinstance(val, str) for val in get_args(arg)))
-                or issubclass(arg, StrEnum)
-                for arg in args
-            ):
-                return True
-        return False
+        args = NodeVisitor._union_args(annotation)
+        return args is not None and all(NodeVisitor._is_str_arg(arg) for arg in args)
+
+    @staticmethod
+    @functools.cache
+    def _is_str_arg(arg: type) -> bool:
+        """
+        Check if the provided union argument is string-like (i.e., a string, literal of strings,
+        or enum value) or `None`. The result is computed once per argument.
+
+        Args:
+            arg (type): The union argument to check.
+
+        Returns:
+            bool: True if the argument is string-like or `None`, False otherwise.
+
+        """
+        if arg is str or arg is NoneType:
+            return True
+        if get_origin(arg) is Literal:
+            return all(isinstance(val, str) for val in get_args(arg))
+        return issubclass(arg, StrEnum)
 
     @staticmethod
     def _is_date(annotation: type) -> bool:
@@ -165,11 +237,8 @@ class NodeVisitor(ParsimoniousNodeVisitor):
         """
         if annotation is datetime.date:
             return True
-        if isinstance(annotation, UnionType) or get_origin(annotation) is Union:
-            args = get_args(annotation)
-            if all(arg is datetime.date or arg is NoneType for arg in args):
-                return True
-        return False
+        args = NodeVisitor._union_args(annotation)
+        return args is not None and all(arg is datetime.date or arg is NoneType for arg in args)
 
     @staticmethod
     def _is_int(annotation: type) -> bool:
@@ -186,11 +255,8 @@ class NodeVisitor(ParsimoniousNodeVisitor):
         """
         if annotation is int:
             return True
-        if isinstance(annotation, UnionType) or get_origin(annotation) is Union:
-            args = get_args(annotation)
-            if all(arg is int or arg is NoneType for arg in args):
-                return True
-        return False
+        args = NodeVisitor._union_args(annotation)
+        return args is not None and all(arg is int or arg is NoneType for arg in args)
 
     @staticmethod
     def _is_list(annotation: type) -> bool:
@@ -240,32 +306,33 @@ class NodeVisitor(ParsimoniousNodeVisitor):
         return False
 
     @staticmethod
-    def flatten(visited_children: list[Any]) -> Iterable[Any]:
+    def flatten(visited_children: list[Any]) -> list[Any]:
         """
-        Recursively flatten a list of iterables, removing all non-visited nodes.
+        Flatten nested lists of visited children, removing all non-visited nodes.
+
+        Nested lists (i.e., the visited children returned by `generic_visit`) are expanded in place using an
+        explicit stack, preserving the order of their items. Anything else, including the `(field_name, value)`
+        pairs returned by the generated visitor methods, is kept whole.
 
         Args:
-            visited_children (list[Any]): A list of visited children nodes, which may include nested structures
-                such as lists, dictionaries, or other iterables.
+            visited_children (list[Any]): A list of visited children nodes, which may include nested lists.
 
-        Yields:
-            Any: Flattened items from the visited children, yielding only terminal nodes or non-iterable items.
+        Returns:
+            list[Any]: Flattened items from the visited children, excluding any non-visited nodes.
 
         """
+        flattened = []
+        stack = list(reversed(visited_children))
+        while stack:
+            item = stack.pop()
+            # NOTE: Type identity, rather than `isinstance` against `Iterable`, since only plain lists are nested
+            if item.__class__ is list:
+                if item:
+                    stack.extend(reversed(item))
+            elif not isinstance(item, Node):
+                flattened.append(item)
 
-        def can_flatten(thing):
-            if isinstance(thing, str | dict | bytes):
-                return False
-            return isinstance(thing, Iterable)
-
-        for item in visited_children:
-            if isinstance(item, Node):
-                continue
-
-            if not can_flatten(item):
-                yield item
-            else:
-                yield from NodeVisitor.flatten(item)
+        return flattened
 
     @classmethod
     def _add_str_visitor(cls, field_name: str) -> None:
@@ -273,16 +340,16 @@ class NodeVisitor(ParsimoniousNodeVisitor):
         Add a visitor method for string fields in the Pydantic model.
 
         This method creates a visitor that extracts the text from the node,
-        strips any leading or trailing whitespace, and returns it as a dictionary
-        with the field name as the key.
+        strips any leading or trailing whitespace, and returns it paired with the
+        field name.
 
         Args:
             field_name (str): The name of the field in the Pydantic model.
 
         """
 
-        def _visitor(self, node: Node, visited_children: list[Any]) -> dict[str, str]:
-            return {field_name: node.text.strip()}
+        def _visitor(self, node: Node, visited_children: list[Any]) -> tuple[str, str]:
+            return field_name, node.text.strip()
 
         setattr(cls, f"visit_{field_name}", _visitor)
 
@@ -291,16 +358,23 @@ class NodeVisitor(ParsimoniousNodeVisitor):
         """
         Add a visitor method for date fields in the Pydantic model.
 
-        This method creates a visitor that parses the date from the node's text
-        and returns it as a dictionary with the field name as the key.
+        This method creates a visitor that parses the date from the node's text,
+        trying the known release date formats before falling back to `dateutil`,
+        and returns it paired with the field name.
 
         Args:
             field_name (str): The name of the field in the Pydantic model.
 
         """
 
-        def _visitor(self, node: Node, visited_children: list[Any]) -> dict[str, datetime.date]:
-            return {field_name: date_parser.parse(node.text.strip()).date()}
+        def _visitor(self, node: Node, visited_children: list[Any]) -> tuple[str, datetime.date]:
+            text = node.text.strip()
+            for date_format in _DATE_FORMATS:
+                try:
+                    return field_name, datetime.datetime.strptime(text, date_format).date()
+                except ValueError:
+                    pass
+            return field_name, date_parser.parse(text).date()
 
         setattr(cls, f"visit_{field_name}", _visitor)
 
@@ -310,17 +384,17 @@ class NodeVisitor(ParsimoniousNodeVisitor):
         Add a visitor method for integer fields in the Pydantic model.
 
         This method creates a visitor that extracts the text from the node,
-        removes any commas, converts it to an integer, and returns it as a
-        dictionary with the field name as the key.
+        removes any commas, converts it to an integer, and returns it paired
+        with the field name.
 
         Args:
             field_name (str): The name of the field in the Pydantic model.
 
         """
 
-        def _visitor(self, node: Node, visited_children: list[Any]) -> dict[str, int]:
+        def _visitor(self, node: Node, visited_children: list[Any]) -> tuple[str, int]:
             text = node.text.strip()
-            return {field_name: int(text.replace(",", ""))}
+            return field_name, int(text.replace(",", "") if "," in text else text)
 
         setattr(cls, f"visit_{field_name}", _visitor)
 
@@ -347,15 +421,16 @@ class NodeVisitor(ParsimoniousNodeVisitor):
             cls._add_int_visitor(field_name)
 
     @staticmethod
-    def _get_list_fields(model_class: BaseModel) -> list[str]:
+    @functools.cache
+    def _get_list_fields(model_class: BaseModel) -> tuple[str, ...]:
         """
-        Get the list fields from a Pydantic model class.
+        Get the list fields from a Pydantic model class, once per model class.
 
         Args:
             model_class (BaseModel): The Pydantic model class to inspect.
 
         Returns:
-            list[str]: A list of field names that are lists in the model.
+            tuple[str, ...]: The field names that are lists in the model.
 
         """
         list_fields = []
@@ -363,40 +438,40 @@ class NodeVisitor(ParsimoniousNodeVisitor):
             if get_origin(_field_type) is list:
                 list_fields.append(_field_name)
 
-        return list_fields
+        return tuple(list_fields)
 
     @classmethod
     def _add_model_visitor(cls, field_name: str, model_class: BaseModel, include_key: bool = True) -> None:
         """
         Add a visitor method for fields that are Pydantic models.
 
-        This method creates a visitor that collects child nodes into a dictionary,
-        where each key corresponds to a field in the model.
+        This method creates a visitor that collects the `(field_name, value)` pairs of child
+        nodes into a dictionary, where each key corresponds to a field in the model.
 
         If there are multiple children with the same key, and their respective values are strings,
         they are concatenated with a space in between. If the values are lists, they are
         aggregated into a single list.
 
-        If `include_key` is True, the field name is included as a key in the returned dictionary.
+        If `include_key` is True, the dictionary is returned paired with the field name.
         This is typically the difference between `attr: list[BaseModel]` and `attr: BaseModel`.
 
         Args:
             field_name (str): The name of the field in the Pydantic model.
             model_class (BaseModel): The Pydantic model class to use for creating the visitor.
-            include_key (bool): Whether to include the field name as a key in the returned dictionary.
+            include_key (bool): Whether to pair the returned dictionary with the field name.
 
         """
         list_fields = cls._get_list_fields(model_class)
+        list_fields_set = frozenset(list_fields)
+        # NOTE: Resolved once here so that each call reads a closure variable instead of a global and an attribute
+        flatten = NodeVisitor.flatten
 
-        def _visitor(self, node: Node, visited_children: list[Any]) -> dict[str, Any]:
+        def _visitor(self, node: Node, visited_children: list[Any]) -> tuple[str, dict[str, Any]] | dict[str, Any]:
             model = {field: [] for field in list_fields}
-            for child in NodeVisitor.flatten(visited_children):
-                if isinstance(child, dict):
-                    if len(child) != 1:
-                        logger.warning(f"Unexpected child dictionary length ({len(child)}) in `{field_name}` visitor.")
-                        continue
-                    key, value = next(iter(child.items()))
-                    if key in list_fields:
+            for child in flatten(visited_children):
+                if child.__class__ is tuple:
+                    key, value = child
+                    if key in list_fields_set:
                         if isinstance(value, list):
                             model[key].extend(value)
                         else:
@@ -407,18 +482,59 @@ class NodeVisitor(ParsimoniousNodeVisitor):
                         else:
                             logger.warning(f"Unexpected duplicate key (`{key}`) in `{field_name}` visitor.")
                     else:
-                        model.update(child)
+                        model[key] = value
                 else:
                     logger.warning(f"Unexpected child type ({type(child)}) in `{field_name}` visitor.")
 
             if include_key:
-                return {field_name: model}
+                return field_name, model
 
             return model
 
         setattr(cls, f"visit_{field_name}", _visitor)
 
-    def generic_visit(self, node: Node, visited_children: list[Any]) -> list[Any] | Node:
+    def visit(self, node: Node) -> Any:
+        """
+        Walk the parse tree, dispatching each node to the visitor method named after its
+        rule once all of its children have been visited.
+
+        Unlike the recursive implementation of the parent class, the tree is traversed
+        iteratively with an explicit stack, and visitor methods are looked up in a table
+        built once at initialization.
+
+        Args:
+            node (Node): The root node of the tree to visit.
+
+        Returns:
+            Any: The result of the visitor method of the root node.
+
+        Raises:
+            VisitationError: If a visitor method raises an exception that is not in `unwrapped_exceptions`.
+
+        """
+        results: list[Any] = []
+        stack: list[tuple[Node, Iterator[Node], list[Any], list[Any]]] = [(node, iter(node), [], results)]
+        while stack:
+            current, children, visited_children, parent_results = stack[-1]
+            child = next(children, None)
+            if child is not None:
+                stack.append((child, iter(child), [], visited_children))
+                continue
+
+            stack.pop()
+            method = self._visit_table.get(current.expr_name, self.generic_visit)
+            try:
+                parent_results.append(method(current, visited_children))
+            except (VisitationError, UndefinedLabel):
+                raise
+            except Exception as exc:
+                if isinstance(exc, self.unwrapped_exceptions):
+                    raise
+                raise VisitationError(exc, type(exc), current) from exc
+
+        return results[0]
+
+    def generic_visit(self, node: Node, visited_children: list[Any]) -> list[Any]:
         """
         Override the generic visit method to handle cases where no specific visitor
         method is defined.
@@ -428,10 +544,11 @@ class NodeVisitor(ParsimoniousNodeVisitor):
             visited_children (list[Any]): A list of children nodes that were visited.
 
         Returns:
-            list[Any] | Node: The visited children if any, or the node itself if no children were visited.
+            list[Any]: The visited children, which is empty for leaf nodes. Returning the (already allocated)
+                empty list rather than the node itself lets `flatten` discard it without a type check.
 
         """
-        return visited_children or node
+        return visited_children
 
     def serialize(self, tree: Node) -> BaseModel:
         """
@@ -446,3 +563,16 @@ class NodeVisitor(ParsimoniousNodeVisitor):
         """
         result = self.visit(tree)
         return self.model_class.model_validate(result)
+
+
+_FIELD_VISITOR_ADDERS: dict[FieldKind, Callable[[type[NodeVisitor], str, type], None]] = {
+    FieldKind.STR: lambda cls, field_name, field_type: cls._add_str_visitor(field_name),
+    FieldKind.DATE: lambda cls, field_name, field_type: cls._add_date_visitor(field_name),
+    FieldKind.INT: lambda cls, field_name, field_type: cls._add_int_visitor(field_name),
+    FieldKind.LIST_OF_MODEL: lambda cls, field_name, field_type: cls._add_list_of_model_visitors(
+        field_name, field_type
+    ),
+    FieldKind.MODEL: lambda cls, field_name, field_type: cls._add_nested_model_visitors(field_name, field_type),
+    FieldKind.LIST: lambda cls, field_name, field_type: cls._add_list_visitor(field_name, field_type),
+    FieldKind.UNSUPPORTED: lambda cls, field_name, field_type: cls._warn_unsupported_field(field_name, field_type),
+}
@@ -1,4 +1,5 @@
 from enum import Enum, EnumMeta, StrEnum
+from typing import Self
 
 
 class Entry(StrEnum):
@@ -6,6 +7,9 @@ class Entry(StrEnum):
 
     RESOURCES = "/Resources"
     FONT = "/Font"
+    XOBJECT = "/XObject"
+    SUBTYPE = "/Subtype"
+    FORM = "/Form"
 
 
 class FontEntry(StrEnum):
@@ -61,20 +65,33 @@ class BytesEnumMeta(EnumMeta):
     """Metaclass for byte enumerators that allows iteration and membership testing based
     on the byte values of the enum members."""
 
+    def __new__(metacls, cls, bases, classdict, **kwargs):
+        enum_class = super().__new__(metacls, cls, bases, classdict, **kwargs)
+        # NOTE: Member values are fixed at class creation, so they are collected once for iteration and membership
+        enum_class._values = tuple(member.value for member in enum_class.__members__.values())
+        enum_class._members_by_value = {member.value: member for member in enum_class.__members__.values()}
+        return enum_class
+
     def __iter__(cls):
-        return (member.value for member in cls.__members__.values())
+        return iter(cls._values)
 
     def __contains__(cls, item):
-        if isinstance(item, bytes):
-            return any(item == member.value for member in cls.__members__.values())
-        return False
+        return isinstance(item, bytes) and item in cls._members_by_value
 
 
 class BytesEnum(bytes, Enum, metaclass=BytesEnumMeta):
     """Base class for byte enumerators that allows iteration and membership testing
     based on the byte values of the enum members."""
 
-    pass
+    @classmethod
+    def lookup(cls, value: bytes) -> Self | None:
+        """
+        Returns the member with the provided byte value, or None if there is no such member.
+
+        Members are singletons, so the result can be compared by identity (e.g., `op is Operator.SET_FONT`).
+
+        """
+        return cls._members_by_value.get(value)
 
 
 class Operator(BytesEnum):
@@ -87,3 +104,4 @@ class Operator(BytesEnum):
     SET_FONT = b"Tf"
     SHOW_TEXT_STRING = b"Tj"
     SHOW_TEXT_STRINGS = b"TJ"
+    DRAW_OBJECT = b"Do"
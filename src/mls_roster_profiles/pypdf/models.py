@@ -1,88 +1,30 @@
 from __future__ import annotations
 
+import codecs
 import math
+from dataclasses import dataclass
 from functools import cached_property
-from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 from pypdf import PageObject
 from pypdf._cmap import _parse_to_unicode
-from pypdf.generic import DictionaryObject, EncodedStreamObject, IndirectObject, NameObject
+from pypdf.generic import IndirectObject
 
 from mls_roster_profiles.pypdf.enum import DelimiterGlyph, Entry, FontEntry, FontWeight
 
+_DELIMITER_GLYPHS = frozenset(DelimiterGlyph)
 
-class Type1FontDictionary(BaseModel):
-    """
-    Represents a Type 1 font dictionary in a PDF file.
-
-    Attributes:
-        type_ (Literal[Entry.FONT]): Type of the dictionary. Must always be "/Font".
-        subtype (Literal["/Type1", "/TrueType"]): Subtype of the font. Must always be "/Type1" or "/TrueType".
-        base_font (str): Base font name, which is the name of the font resource.
-        first_character (int): The first character code in the font.
-        last_character (int): The last character code in the font.
-        widths (list[int]): List of widths for each character in the font, indexed by character code.
-        font_descriptor (DictionaryObject): Optional font descriptor dictionary containing additional font properties.
-        encoding (str | DictionaryObject | None): Optional encoding name for the font, if not specified, the font uses a default encoding.
-        to_unicode (EncodedStreamObject): Optional ToUnicode CMap for mapping character codes to Unicode values.
+# NOTE: Marks undefined character codes in `codecs.charmap_decode` decoding tables
+_UNDEFINED_GLYPH = "\ufffe"
 
-    """
-
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
-    type_: Literal[Entry.FONT] = Field(
-        default=Entry.FONT,
-        validation_alias=FontEntry.TYPE,
-        serialization_alias="type",
-        description='Type of the dictionary. Must always be "/Font".',
-    )
-    subtype: Literal["/Type1", "/TrueType"] = Field(
-        default=...,
-        validation_alias=FontEntry.SUBTYPE,
-        description='Subtype of the font. Must always be "/Type1" or "/TrueType".',
-    )
-    base_font: str = Field(
-        default=...,
-        validation_alias=FontEntry.BASE_FONT,
-        description="Base font name, which is the name of the font resource.",
-    )
-    first_character: int = Field(
-        default=...,
-        validation_alias=FontEntry.FIRST_CHARACTER,
-        description="The first character code in the font.",
-    )
-    last_character: int = Field(
-        default=...,
-        validation_alias=FontEntry.LAST_CHARACTER,
-        description="The last character code in the font.",
-    )
-    widths: list[int] = Field(
-        default=...,
-        validation_alias=FontEntry.WIDTHS,
-        description="List of widths for each character in the font, indexed by character code.",
-    )
-    font_descriptor: DictionaryObject = Field(
-        default=...,
-        validation_alias=FontEntry.FONT_DESCRIPTOR,
-        description="Optional font descriptor dictionary containing additional font properties.",
-    )
-    encoding: str | DictionaryObject | None = Field(
-        default=None,
-        validation_alias=FontEntry.ENCODING,
-        description="Optional encoding name for the font, if not specified, the font uses a default encoding.",
-    )
-    to_unicode: EncodedStreamObject = Field(
-        default=...,
-        validation_alias=FontEntry.TO_UNICODE,
-        description="Optional ToUnicode CMap for mapping character codes to Unicode values.",
-    )
+# NOTE: Plain string copies of the delimiter glyphs appended to every serialized text object, which are cheaper to
+#       look up than the enum members
+_ATTRIBUTES_OPEN = str(DelimiterGlyph.ATTRIBUTES_OPEN)
+_ATTRIBUTES_CLOSE = str(DelimiterGlyph.ATTRIBUTES_CLOSE)
+_END_OBJECT = str(DelimiterGlyph.END_OBJECT)
 
-    @field_validator("subtype", mode="before")
-    def validate_subtype(cls, value) -> str:
-        """Converts the subtype to a string if it is passed as a `NameObject`."""
-        if isinstance(value, NameObject):
-            return str(value)
+# NOTE: The simple font subtypes whose widths can be read from the "/FirstChar", "/LastChar" and "/Widths" entries
+_SIMPLE_FONT_SUBTYPES = frozenset({"/Type1", "/TrueType"})
 
 
 class Font(BaseModel):
@@ -116,12 +58,12 @@ class Font(BaseModel):
         description="Dictionary object representing the font, containing properties like type, subtype, base font, etc.",
     )
 
-    @computed_field
     @cached_property
     def weight(self) -> FontWeight:
-        if FontWeight.BOLD in self.font.lower():
+        font = self.font.lower()
+        if FontWeight.BOLD in font:
             return FontWeight.BOLD
-        elif FontWeight.LIGHT in self.font.lower():
+        elif FontWeight.LIGHT in font:
             return FontWeight.LIGHT
         return FontWeight.REGULAR
 
@@ -135,12 +77,21 @@ class Font(BaseModel):
         reserved for internal use.
 
         """
-        overlapping_glyphs = list(set(characters) & set(DelimiterGlyph))
+        overlapping_glyphs = list(_DELIMITER_GLYPHS.intersection(characters))
         if overlapping_glyphs:
             overlapping_glyphs_str = '", "'.join(overlapping_glyphs)
             raise ValueError(f'Delimiter glyphs "{overlapping_glyphs_str}" are not allowed in the font.')  # noqa: TRY003
 
-    @computed_field
+    @staticmethod
+    def integral(value: object) -> int:
+        """
+        Converts a numeric font dictionary entry to an integer, raising a ValueError if it is not a whole
+        number (e.g., a fractional width), rather than silently truncating it.
+        """
+        if isinstance(value, bool) or not isinstance(value, int | float) or not float(value).is_integer():
+            raise ValueError(f"Font dictionary entry must be an integer, not {value!r}.")  # noqa: TRY003
+        return int(value)
+
     @cached_property
     def characters(self) -> dict[int, str]:
         """
@@ -164,7 +115,6 @@ class Font(BaseModel):
 
         return {ord(key): value for key, value in characters.items()}
 
-    @computed_field
     @cached_property
     def widths(self) -> dict[int, int]:
         """
@@ -174,18 +124,44 @@ class Font(BaseModel):
             dict[int, int]: A dictionary mapping character codes (int) to their corresponding widths (int).
 
         Raises:
-            ValueError: If the font dictionary does not contain the required properties for width calculation.
+            ValueError: If the font is not a Type 1 or TrueType font, or if the font dictionary does not contain the
+                required properties for width calculation, or any of them is not a whole number.
 
         """
-        font_dictionary = Type1FontDictionary(**self.font_dictionary)
+        font_dictionary = self.font_dictionary.get_object()
+        subtype = font_dictionary.get(FontEntry.SUBTYPE)
+        if subtype not in _SIMPLE_FONT_SUBTYPES:
+            raise ValueError(f'Font subtype must be "/Type1" or "/TrueType", not "{subtype}".')  # noqa: TRY003
+
+        try:
+            first_character = self.integral(font_dictionary[FontEntry.FIRST_CHARACTER])
+            last_character = self.integral(font_dictionary[FontEntry.LAST_CHARACTER])
+            character_widths = [self.integral(width) for width in font_dictionary[FontEntry.WIDTHS]]
+        except KeyError as e:
+            raise ValueError(f"Font dictionary is missing a required entry: {e}") from e  # noqa: TRY003
 
         widths = {}
-        for idx in range(font_dictionary.first_character, font_dictionary.last_character + 1):
+        for idx in range(first_character, last_character + 1):
             if idx in self.characters:
-                widths[idx] = font_dictionary.widths[idx - font_dictionary.first_character]
+                widths[idx] = character_widths[idx - first_character]
 
         return widths
 
+    @cached_property
+    def _decoding_table(self) -> str | None:
+        """
+        Builds a 256-character decoding table for `codecs.charmap_decode` from the character mapping, where each
+        position holds the glyph for that single-byte character code, and undefined codes hold U+FFFE.
+
+        Returns:
+            str | None: The decoding table, or None if any glyph spans multiple characters (or is itself U+FFFE),
+                in which case the table cannot represent the mapping.
+
+        """
+        if any(len(glyph) != 1 or glyph == _UNDEFINED_GLYPH for glyph in self.characters.values()):
+            return None
+        return "".join(self.characters.get(idx, _UNDEFINED_GLYPH) for idx in range(256))
+
     @classmethod
     def from_operands(cls, operands: list[str | float], page: PageObject) -> Font:
         """
@@ -230,17 +206,22 @@ class Font(BaseModel):
             tuple[str, int]: A tuple containing the decoded content (str) and the total width (int) of the content.
 
         """
-        content = ""
-        width = 0
+        # NOTE: Raises a `KeyError` for any character code missing from the font, as `widths` only holds codes
+        #       that are also in `characters`
+        width = sum(map(self.widths.__getitem__, byte_string))
 
-        for char_idx in byte_string:
-            content += self.characters[char_idx]
-            width += self.widths[char_idx]
+        if self._decoding_table is not None:
+            content, _ = codecs.charmap_decode(byte_string, "strict", self._decoding_table)
+        else:
+            # NOTE: Decoding as Latin-1 maps each byte to the code point of the same value, which `characters` then
+            #       translates to its glyph(s) in a single pass
+            content = byte_string.decode("latin-1").translate(self.characters)
 
         return content, width
 
 
-class BoundingBox(BaseModel):
+@dataclass(slots=True)
+class BoundingBox:
     """
     Represents a bounding box defined by its minimum x and y coordinates, width, and
     height.
@@ -257,27 +238,23 @@ class BoundingBox(BaseModel):
 
     """
 
-    model_config = ConfigDict(validate_assignment=True)
+    # NOTE: A plain dataclass rather than a Pydantic model, as the bounding box of every text object is written to
+    #       by each text-showing operator
 
-    x_min: int = Field(
-        default=0,
-        description="Minimum x-coordinate of the bounding box.",
-    )
-    y_min: int = Field(
-        default=0,
-        description="Minimum y-coordinate of the bounding box.",
-    )
-    width: int = Field(
-        default=0,
-        description="Width of the bounding box.",
-    )
-    height: int = Field(
-        default=0,
-        description="Height of the bounding box. Currently unused.",
-    )
+    x_min: int = 0
+    y_min: int = 0
+    width: int = 0
+    height: int = 0
+
+    def __post_init__(self) -> None:
+        self.x_min = self.ceiling(self.x_min)
+        self.y_min = self.ceiling(self.y_min)
+        self.width = self.ceiling(self.width)
+        self.height = self.ceiling(self.height)
 
-    @field_validator("x_min", "y_min", "width", "height", mode="before")
-    def ceiling(cls, value):
+    @staticmethod
+    def ceiling(value: int | float) -> int:
+        """Rounds float coordinates up to the nearest integer, leaving integers as is."""
         if isinstance(value, float):
             return math.ceil(value)
         return value
@@ -300,7 +277,8 @@ class BoundingBox(BaseModel):
     @property
     def x_center(self) -> int:
         """X-coordinate of the center of the bounding box."""
-        return math.ceil(self.x_min + self.width / 2)
+        # NOTE: Integer equivalent of `math.ceil(self.x_min + self.width / 2)`, as all coordinates are integers
+        return self.x_min + (self.width + 1) // 2
 
     @property
     def y_center(self) -> int:
@@ -310,10 +288,11 @@ class BoundingBox(BaseModel):
         Currently unused.
 
         """
-        return math.ceil(self.y_min + self.height / 2)
+        return self.y_min + (self.height + 1) // 2
 
 
-class TextObject(BaseModel):
+@dataclass(slots=True)
+class TextObject:
     """
     Stores text object properties.
 
@@ -324,20 +303,9 @@ class TextObject(BaseModel):
 
     """
 
-    model_config = ConfigDict(validate_assignment=True)
-
-    content: str = Field(
-        default="",
-        description="The text contained in the object.",
-    )
-    font: Font | None = Field(
-        default=None,
-        description="Font used for the text object, containing font name and size.",
-    )
-    bounding_box: BoundingBox | None = Field(
-        default=None,
-        description="Bounding box of the text object, defined by its minimum x and y coordinates, width, and height.",
-    )
+    content: str = ""
+    font: Font | None = None
+    bounding_box: BoundingBox | None = None
 
     def serialize(self) -> str:
         """
@@ -357,11 +325,11 @@ class TextObject(BaseModel):
         x_coordinates = [self.bounding_box.x_min, self.bounding_box.x_center, self.bounding_box.x_max]
         font_weight = self.font.weight
 
-        object_attributes = DelimiterGlyph.ATTRIBUTES_OPEN
+        object_attributes = _ATTRIBUTES_OPEN
         object_attributes += "|".join(str(attr).strip() for attr in [*x_coordinates, font_weight])
-        object_attributes += DelimiterGlyph.ATTRIBUTES_CLOSE
+        object_attributes += _ATTRIBUTES_CLOSE
 
         content += object_attributes
-        content += DelimiterGlyph.END_OBJECT
+        content += _END_OBJECT
 
         return content
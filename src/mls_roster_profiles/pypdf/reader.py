@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import math
+from collections.abc import Callable, Iterator
 from typing import Any
 
-from numpy import matmul
 from pypdf import PageObject, PdfReader
+from pypdf.constants import PageAttributes
+from pypdf.generic import ContentStream, NameObject
 
-from mls_roster_profiles.pypdf.enum import DelimiterGlyph, Operator
+from mls_roster_profiles.pypdf.enum import DelimiterGlyph, Entry, Operator
 from mls_roster_profiles.pypdf.models import BoundingBox, Font, TextObject
 
+# NOTE: Plain string copies of the delimiter glyphs appended during text extraction, which are cheaper to look up than
+#       the enum members
+_RETURN = str(DelimiterGlyph.RETURN)
+_PRECEDES = str(DelimiterGlyph.PRECEDES)
+_TAB = str(DelimiterGlyph.TAB)
+
 
 class Page(PageObject):
     """
@@ -25,6 +34,8 @@ class Page(PageObject):
         _text_object (TextObject): Text object that is presently being constructed by the text extraction process.
         _font (Font | None): Font family and size of the present text object.
         _font_stack (list[Font]): Stack of font states that have been pushed to by the "q" operator.
+        _fonts (dict[tuple[str, float], Font]): Fonts already created for this page, keyed by the operands of the "Tf"
+            operator, so that each font's character mappings are only parsed once.
         _x_displacement (float): Tracks how much horizontal space is presently taken up by this line of text, in unscaled text units.
         _td_x_translation (float): Sum total of x translations from "Td" operations within the present text object.
         _td_y_translation (float): Sum total of y translations from "Td" operations within the present text object.
@@ -51,11 +62,112 @@ class Page(PageObject):
         self._text_object: TextObject = TextObject()
         self._font: Font | None = None
         self._font_stack: list[Font] = []
+        self._fonts: dict[tuple[str, float], Font] = {}
 
         self._x_displacement: float = 0.0
         self._td_x_translation: float = 0.0
         self._td_y_translation: float = 0.0
 
+    def _content_stream(self) -> ContentStream | None:
+        """
+        Returns the page's content stream, parsed with the same byte string encoding that
+        `extract_text` uses. The parsed stream replaces the page's contents, so that its
+        operations are only ever parsed once.
+
+        Returns:
+            ContentStream | None: The parsed content stream, or None if the page has no contents.
+
+        """
+        contents = self.get(PageAttributes.CONTENTS)
+        if contents is None:
+            return None
+
+        contents = contents.get_object()
+        if not isinstance(contents, ContentStream):
+            contents = ContentStream(contents, self.pdf, "bytes")
+            self[NameObject(PageAttributes.CONTENTS)] = contents
+
+        return contents
+
+    def contains(self, needle: str) -> bool:
+        """
+        Checks whether the page's text contains the provided string, without performing
+        a full text extraction.
+
+        Decodes the strings shown by the "Tj" and "TJ" operators in content stream order, ignoring their
+        positioning, and returns as soon as the string is found. Form XObjects are not inspected, so any page
+        drawing one is conservatively assumed to contain the string.
+
+        Args:
+            needle (str): The string to search for.
+
+        Returns:
+            bool: True if the string may be present in the extracted text, False if it certainly is not.
+
+        """
+        contents = self._content_stream()
+        if contents is None:
+            return False
+
+        tail = ""
+        for content in self._iter_shown_text(contents):
+            if content is None:
+                return True
+
+            tail += content
+            if needle in tail:
+                return True
+            tail = tail[max(len(tail) - len(needle) + 1, 0) :]
+
+        return False
+
+    def _iter_shown_text(self, contents: ContentStream) -> Iterator[str | None]:
+        """
+        Decodes the text shown by each "Tj" and "TJ" operator in the content stream,
+        tracking font changes along the way.
+
+        Args:
+            contents (ContentStream): The parsed content stream of the page.
+
+        Yields:
+            str | None: The decoded text of each text-showing operator, or None when a form XObject is drawn.
+
+        """
+        font: Font | None = None
+        font_stack: list[Font | None] = []
+
+        for operands, operator in contents.operations:
+            op = Operator.lookup(operator)
+            if op is Operator.SET_FONT:
+                font = self._get_font(operands=operands)
+            elif op is Operator.SAVE_GRAPHICS_STATE:
+                font_stack.append(font)
+            elif op is Operator.RESTORE_GRAPHICS_STATE:
+                font = font_stack.pop() if font_stack else None
+            elif op is Operator.DRAW_OBJECT:
+                if self._is_form_xobject(operands[0]):
+                    yield None
+            elif (op is Operator.SHOW_TEXT_STRING or op is Operator.SHOW_TEXT_STRINGS) and font is not None:
+                byte_strings = operands if op is Operator.SHOW_TEXT_STRING else operands[0]
+                yield "".join(font.decode(byte_string=b)[0] for b in byte_strings if isinstance(b, bytes))
+
+    def _is_form_xobject(self, name: str) -> bool:
+        """
+        Checks whether the named XObject resource is a form, which may itself contain text.
+
+        Args:
+            name (str): The name of the XObject resource.
+
+        Returns:
+            bool: True if the XObject is a form (or cannot be resolved), False otherwise.
+
+        """
+        try:
+            xobject = self[Entry.RESOURCES][Entry.XOBJECT][name].get_object()
+        except KeyError:
+            return True
+        return xobject.get(Entry.SUBTYPE) == Entry.FORM
+
     def extract_text(self) -> str:
         """
         Extracts text from the page using a visitor pattern to handle operands before
@@ -66,6 +178,18 @@ class Page(PageObject):
 
         """
 
+        # NOTE: `Operator` members hash and compare equal to their byte values, so the raw operators passed to the
+        #       visitor can be looked up directly
+        handlers: dict[Operator, Callable[[list[Any], list[float], list[float]], None]] = {
+            Operator.END_TEXT_OBJECT: lambda *_: self._end_text_object(),
+            Operator.SAVE_GRAPHICS_STATE: lambda *_: self._save_graphics_state(),
+            Operator.RESTORE_GRAPHICS_STATE: lambda *_: self._restore_graphics_state(),
+            Operator.MOVE_TEXT_POSITION: lambda operands, *_: self._move_text_position(operands=operands),
+            Operator.SET_FONT: lambda operands, *_: self._set_font(operands=operands),
+            Operator.SHOW_TEXT_STRING: self._show_text_string,
+            Operator.SHOW_TEXT_STRINGS: self._show_text_strings,
+        }
+
         def visitor_operand_before(
             operator: bytes,
             operands: list[Any],
@@ -73,7 +197,8 @@ class Page(PageObject):
             tm_matrix: list[float],
         ) -> None:
             """
-            Visitor function to handle operands before processing them.
+            Visitor function to handle operands before processing them, dispatching each handled operator
+            to its handler with a single lookup.
 
             Args:
                 operator (bytes): The operator being processed.
@@ -82,20 +207,9 @@ class Page(PageObject):
                 tm_matrix (list[float]): The text matrix for the content stream.
 
             """
-            if operator == Operator.END_TEXT_OBJECT:
-                self._end_text_object()
-            elif operator == Operator.SAVE_GRAPHICS_STATE:
-                self._save_graphics_state()
-            elif operator == Operator.RESTORE_GRAPHICS_STATE:
-                self._restore_graphics_state()
-            elif operator == Operator.MOVE_TEXT_POSITION:
-                self._move_text_position(operands=operands)
-            elif operator == Operator.SET_FONT:
-                self._set_font(operands=operands)
-            elif operator == Operator.SHOW_TEXT_STRING:
-                self._show_text_string(operands=operands, cm_matrix=cm_matrix, tm_matrix=tm_matrix)
-            elif operator == Operator.SHOW_TEXT_STRINGS:
-                self._show_text_strings(operands=operands, cm_matrix=cm_matrix, tm_matrix=tm_matrix)
+            handler = handlers.get(operator)
+            if handler is not None:
+                handler(operands, cm_matrix, tm_matrix)
 
         super().extract_text(visitor_operand_before=visitor_operand_before)
 
@@ -110,13 +224,12 @@ class Page(PageObject):
         used for that purpose.
 
         """
-        if self._text_object.content:
-            if self._text_object.content.endswith(DelimiterGlyph.RETURN):
-                self._text_object.content = self._text_object.content[:-1]
-
-            self._text_object.content = self._text_object.content.strip()
-            self._text_object.font = self._font
-            self.text_objects.append(self._text_object)
+        text_object = self._text_object
+        if text_object.content:
+            # NOTE: A trailing return delimiter is removed before whitespace, in a single assignment
+            text_object.content = text_object.content.removesuffix(_RETURN).strip()
+            text_object.font = self._font
+            self.text_objects.append(text_object)
 
         self._text_object = TextObject()
         self._x_displacement = 0.0
@@ -156,7 +269,7 @@ class Page(PageObject):
         x_translation, y_translation = operands
 
         if y_translation < 0 and abs(x_translation + self._td_x_translation) < x_threshold:
-            self._text_object.content += DelimiterGlyph.RETURN
+            self._text_object.content += _RETURN
             self._td_x_translation = 0
             self._td_y_translation += y_translation
 
@@ -165,20 +278,20 @@ class Page(PageObject):
             self._td_x_translation = 0
 
             if x_translation < 0:
-                self._text_object.content += DelimiterGlyph.PRECEDES
+                self._text_object.content += _PRECEDES
             else:
-                self._text_object.content += DelimiterGlyph.TAB
+                self._text_object.content += _TAB
 
         elif abs(y_translation) >= y_threshold:
             self._end_text_object()
 
         elif x_translation < 0 and self._text_object.content:
-            self._text_object.content += DelimiterGlyph.PRECEDES
+            self._text_object.content += _PRECEDES
 
         elif x_translation > 0 and self._text_object.content:
             x_translation_adjusted = x_translation - self._x_displacement
             if x_translation_adjusted > x_threshold * self._font.size:
-                self._text_object.content += DelimiterGlyph.TAB
+                self._text_object.content += _TAB
             else:
                 self._td_x_translation += x_translation
 
@@ -195,7 +308,26 @@ class Page(PageObject):
 
         """
         self._end_text_object()
-        self._font = Font.from_operands(operands=operands, page=self)
+        self._font = self._get_font(operands=operands)
+
+    def _get_font(self, operands: list[str | float]) -> Font:
+        """
+        Returns the font corresponding to the operands of the "Tf" operator, creating it
+        on first use. Fonts are shared between `contains` and `extract_text`.
+
+        Args:
+            operands (list[str | float]): An array of length 2, where the first element is the
+                font name (string) and the second element is the font size (float).
+
+        Returns:
+            Font: The font for the provided operands.
+
+        """
+        key = tuple(operands)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = Font.from_operands(operands=operands, page=self)
+        return font
 
     def _set_origin(self, cm_matrix: list[float], tm_matrix: list[float]) -> None:
         """
@@ -208,22 +340,11 @@ class Page(PageObject):
 
         """
         if self._text_object.bounding_box is None:
-            tm_matrix_reshaped = [
-                [tm_matrix[0], tm_matrix[1], 0],
-                [tm_matrix[2], tm_matrix[3], 0],
-                [tm_matrix[4], tm_matrix[5], 1],
-            ]
-            cm_matrix_reshaped = [
-                [cm_matrix[0], cm_matrix[1], 0],
-                [cm_matrix[2], cm_matrix[3], 0],
-                [cm_matrix[4], cm_matrix[5], 1],
-            ]
-
-            shortened_matrix = matmul(tm_matrix_reshaped, cm_matrix_reshaped)
-
+            # NOTE: Only the translation components of the product of the text and current transformation matrices
+            #       (i.e., the third row of `tm_matrix @ cm_matrix`, as 3x3 matrices) are needed
             self._text_object.bounding_box = BoundingBox(
-                x_min=shortened_matrix[2, 0],
-                y_min=shortened_matrix[2, 1],
+                x_min=tm_matrix[4] * cm_matrix[0] + tm_matrix[5] * cm_matrix[2] + cm_matrix[4],
+                y_min=tm_matrix[4] * cm_matrix[1] + tm_matrix[5] * cm_matrix[3] + cm_matrix[5],
             )
 
     def _handle_text_string(self, byte_string: bytes) -> None:
@@ -240,7 +361,10 @@ class Page(PageObject):
 
         displacement = width / 1000 * self._font.size
         self._x_displacement += displacement
-        self._text_object.bounding_box.width = max(self._text_object.bounding_box.width, self._x_displacement)
+        # NOTE: The displacement can shrink (e.g., negative "TJ" adjustments, "Td" resets), so the width only grows
+        bounding_box = self._text_object.bounding_box
+        if self._x_displacement > bounding_box.width:
+            bounding_box.width = math.ceil(self._x_displacement)
 
     def _show_text_string(self, operands: list[bytes], cm_matrix: list[float], tm_matrix: list[float]) -> None:
         """
@@ -274,4 +398,6 @@ class Page(PageObject):
                 self._handle_text_string(byte_string=operand)
             else:
                 self._x_displacement += operand / 1000 * self._font.size
-                self._text_object.bounding_box.width = max(self._text_object.bounding_box.width, self._x_displacement)
+                bounding_box = self._text_object.bounding_box
+                if self._x_displacement > bounding_box.width:
+                    bounding_box.width = math.ceil(self._x_displacement)
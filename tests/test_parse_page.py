@@ -0,0 +1,34 @@
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+import mls_roster_profiles
+from mls_roster_profiles import PageParseError, RosterProfileVisitor
+
+PDF_PATH = Path(__file__).parent.parent / "data" / "pdf" / "2025-05-01.pdf"
+
+
+def _failing_visitor(self, node, visited_children):
+    raise ValueError("invalid GAM available")  # noqa: TRY003
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_visitor_failure_is_reraised_with_page_and_source(mocker, max_workers):
+    if max_workers > 1 and multiprocessing.get_start_method() != "fork":
+        pytest.skip("Worker processes only inherit the patched visitor when forked")
+
+    mocker.patch.object(RosterProfileVisitor, "visit_gam_available", _failing_visitor)
+
+    source = mls_roster_profiles.RosterProfileRelease._to_source(PDF_PATH)
+    num_pages = len(mls_roster_profiles._open_pdf(source).pages)
+    tasks = [(0, idx) for idx in range(num_pages)]
+
+    with pytest.raises(PageParseError) as exc_info:
+        list(mls_roster_profiles._iter_parsed_pages([source], tasks, max_workers))
+
+    error = exc_info.value
+    assert error.error_type == "VisitationError"
+    assert "invalid GAM available" in error.message
+    assert error.source == str(PDF_PATH)
+    assert 1 <= error.page <= num_pages